@@ -21,6 +21,8 @@ class EmailServiceProtocol(Protocol):
 class SMTPEmailService:
     """SMTP implementation of email service."""
 
+    __slots__ = ("host", "port")
+
     def __init__(self, host: str, port: int):
         self.host = host
         self.port = port
@@ -34,6 +36,8 @@ class SMTPEmailService:
 class MockEmailService:
     """Mock implementation for testing."""
 
+    __slots__ = ()
+
     def send_email(self, to: str, subject: str, body: str) -> bool:
         print(f"MOCK: Email to {to} with subject '{subject}'")
         return True
@@ -41,8 +45,7 @@ class MockEmailService:
 
 def setup_email_services(scope: DependencyScope):
     """Setup email service dependencies."""
-    scope.register_value("smtp_host", "smtp.example.com")
-    scope.register_value("smtp_port", 587)
+    scope.register_values({"smtp_host": "smtp.example.com", "smtp_port": 587})
 
     def create_smtp_service(host: str = Inject["smtp_host"], port: int = Inject["smtp_port"]) -> EmailServiceProtocol:
         return SMTPEmailService(host, port)
@@ -53,6 +56,8 @@ def setup_email_services(scope: DependencyScope):
 class NotificationService:
     """Service that depends on email service."""
 
+    __slots__ = ("email_service",)
+
     @inject
     def __init__(self, email_service: EmailServiceProtocol = Inject[EmailServiceProtocol]):
         self.email_service = email_service
@@ -67,6 +72,8 @@ class NotificationService:
 class DatabaseConfig:
     """Database configuration class."""
 
+    __slots__ = ("host", "port", "database", "pool_size")
+
     def __init__(self, host: str, port: int, database: str, pool_size: int = 10):
         self.host = host
         self.port = port
@@ -81,6 +88,8 @@ class DatabaseConfig:
 class DatabaseConnection:
     """Database connection class."""
 
+    __slots__ = ("config",)
+
     def __init__(self, config: DatabaseConfig):
         self.config = config
         print(f"Connected to {config.connection_string} (pool_size={config.pool_size})")
@@ -103,6 +112,8 @@ def setup_database(scope: DependencyScope):
 class UserRepository:
     """Repository for user data access."""
 
+    __slots__ = ("db",)
+
     @inject
     def __init__(self, db: DatabaseConnection = Inject["database"]):
         self.db = db
@@ -128,6 +139,8 @@ class CacheServiceProtocol(Protocol):
 class RedisCache:
     """Redis cache implementation."""
 
+    __slots__ = ("host", "port")
+
     def __init__(self, host: str, port: int):
         self.host = host
         self.port = port
@@ -144,8 +157,7 @@ class RedisCache:
 
 def setup_cache(scope: DependencyScope):
     """Setup cache dependencies."""
-    scope.register_value("redis_host", "localhost")
-    scope.register_value("redis_port", 6379)
+    scope.register_values({"redis_host": "localhost", "redis_port": 6379})
 
     def create_redis_cache(host: str = Inject["redis_host"], port: int = Inject["redis_port"]) -> CacheServiceProtocol:
         return RedisCache(host, port)
@@ -156,6 +168,8 @@ def setup_cache(scope: DependencyScope):
 class UserService:
     """Business logic service with multiple dependencies."""
 
+    __slots__ = ("user_repo", "cache", "notification")
+
     @inject
     def __init__(
         self,
@@ -194,6 +208,8 @@ class UserService:
 class LoggerFactory:
     """Factory for creating different types of loggers."""
 
+    __slots__ = ("log_level",)
+
     @inject
     def __init__(self, log_level: str = Inject["log_level"]):
         self.log_level = log_level
@@ -205,6 +221,8 @@ class LoggerFactory:
 class Logger:
     """Simple logger implementation."""
 
+    __slots__ = ("name", "level")
+
     def __init__(self, name: str, level: str = "INFO"):
         self.name = name
         self.level = level
@@ -222,6 +240,8 @@ def setup_logging(scope: DependencyScope):
 class OrderService:
     """Service that creates its own logger via factory."""
 
+    __slots__ = ("logger",)
+
     @inject
     def __init__(self, logger_factory: LoggerFactory = Inject[LoggerFactory]):
         self.logger = logger_factory.create_logger("OrderService")
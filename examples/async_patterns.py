@@ -26,6 +26,8 @@ class AsyncApiClient(Protocol):
 
 
 class HttpApiClient:
+    __slots__ = ("base_url", "api_key")
+
     def __init__(self, base_url: str, api_key: str):
         self.base_url = base_url
         self.api_key = api_key
@@ -68,8 +70,7 @@ async def demonstrate_inject_vs_ainject():
     print("=== @inject vs @ainject Comparison ===")
 
     scope = DependencyScope()
-    scope.register_value("base_url", "https://api.example.com")
-    scope.register_value("api_key", "demo-key")
+    scope.register_values({"base_url": "https://api.example.com", "api_key": "demo-key"})
     scope.register_async_resolver(AsyncApiClient, async_client_factory, evaluate_once=True)
 
     # OLD WAY: Using @inject (requires manual checks)
@@ -114,8 +115,7 @@ async def demonstrate_async_context_manager():
     print("=== Async Context Manager Demo ===")
 
     scope = DependencyScope()
-    scope.register_value("base_url", "https://api.example.com")
-    scope.register_value("api_key", "test-key-123")
+    scope.register_values({"base_url": "https://api.example.com", "api_key": "test-key-123"})
     scope.register_async_resolver(AsyncApiClient, async_client_factory, evaluate_once=True)
 
     async with scope:  # Use async context manager
@@ -137,8 +137,7 @@ async def demonstrate_concurrent_tasks():
     async def task_with_scope(task_id: int, base_url: str):
         # Each task gets its own scope for isolation
         task_scope = DependencyScope()
-        task_scope.register_value("base_url", base_url)
-        task_scope.register_value("api_key", f"key-{task_id}")
+        task_scope.register_values({"base_url": base_url, "api_key": f"key-{task_id}"})
         task_scope.register_async_resolver(AsyncApiClient, async_client_factory)
 
         async with task_scope:
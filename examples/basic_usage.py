@@ -4,6 +4,8 @@ This module demonstrates the fundamental patterns for using Injectipy
 with scope-based dependency management.
 """
 
+from typing import Protocol
+
 from injectipy import DependencyScope, Inject, inject
 
 
@@ -125,34 +127,43 @@ def example_4_class_injection():
         print(f"Custom Service Result: {custom_result}")
 
 
-def example_5_type_based_keys():
-    """Example 5: Using types as dependency keys."""
-    print("\n=== Example 5: Type-based Keys ===")
+class DatabaseProtocol(Protocol):
+    """Protocol defining database interface."""
 
-    from typing import Protocol
+    def query(self, sql: str) -> list:
+        ...
 
-    scope = DependencyScope()
 
-    class DatabaseProtocol(Protocol):
-        """Protocol defining database interface."""
+class PostgreSQLDatabase:
+    """Concrete PostgreSQL implementation."""
+
+    __slots__ = ()
+
+    def query(self, sql: str) -> list:
+        return [f"PostgreSQL result for: {sql}"]
 
-        def query(self, sql: str) -> list:
-            ...
 
-    class PostgreSQLDatabase:
-        """Concrete PostgreSQL implementation."""
+class AppLogger:
+    """Simple logger class."""
 
-        def query(self, sql: str) -> list:
-            return [f"PostgreSQL result for: {sql}"]
+    __slots__ = ()
 
-    class AppLogger:
-        """Simple logger class."""
+    def log(self, message: str):
+        return f"LOG: {message}"
 
-        def log(self, message: str):
-            return f"LOG: {message}"
 
-    scope.register_value(DatabaseProtocol, PostgreSQLDatabase())
-    scope.register_value(AppLogger, AppLogger())
+# Stateless services can be created once and registered in any number of scopes
+POSTGRES_DATABASE = PostgreSQLDatabase()
+APP_LOGGER = AppLogger()
+
+
+def example_5_type_based_keys():
+    """Example 5: Using types as dependency keys."""
+    print("\n=== Example 5: Type-based Keys ===")
+
+    scope = DependencyScope()
+    scope.register_value(DatabaseProtocol, POSTGRES_DATABASE)
+    scope.register_value(AppLogger, APP_LOGGER)
 
     @inject
     def get_users(db: DatabaseProtocol = Inject[DatabaseProtocol], logger: AppLogger = Inject[AppLogger]) -> list:
@@ -5,6 +5,7 @@ scope-based dependency injection, including mocking and test isolation.
 """
 
 from typing import Protocol
+from unittest.mock import Mock
 
 import pytest
 
@@ -46,6 +47,8 @@ class ProductionDatabase:
 class UserService:
     """Business service with dependencies."""
 
+    __slots__ = ("email_service", "database")
+
     @inject
     def __init__(
         self,
@@ -70,11 +73,11 @@ class UserService:
         return results[0]["count"] if results else 0
 
 
-# === Testing with Isolated Store ===
+# === Testing with Isolated Scope ===
 
 
-class TestUserServiceWithIsolatedScope:
-    """Test class demonstrating isolated scope usage."""
+class _UserServiceScopeTestBase:
+    """Shared setup: a fresh scope with mock dependencies for each test."""
 
     def setup_method(self):
         """Create a fresh scope for each test."""
@@ -92,6 +95,10 @@ class TestUserServiceWithIsolatedScope:
         # This should be called within a scope context
         return UserService()
 
+
+class TestUserServiceWithIsolatedScope(_UserServiceScopeTestBase):
+    """Test class demonstrating isolated scope usage."""
+
     def test_register_user_success(self):
         """Test successful user registration."""
         with self.test_scope:
@@ -105,7 +112,7 @@ class TestUserServiceWithIsolatedScope:
 
             # Verify database was called
             assert len(self.mock_database.executed_queries) == 1
-            assert "INSERT INTO users" in self.mock_database.executed_queries[0]
+            assert self.mock_database.executed_queries[0][1] == "insert"
 
             # Verify email was sent
             assert len(self.mock_email_service.sent_emails) == 1
@@ -121,31 +128,15 @@ class TestUserServiceWithIsolatedScope:
             count = service.get_user_count()
 
             assert count == 42
-            assert "SELECT COUNT(*)" in self.mock_database.executed_queries[0]
+            assert self.mock_database.executed_queries[0][1] == "count"
 
 
 # === Testing with Scoped Isolation (Recommended Pattern) ===
 
 
-class TestUserServiceWithScopedIsolation:
+class TestUserServiceWithScopedIsolation(_UserServiceScopeTestBase):
     """Test class using scoped isolation pattern."""
 
-    def setup_method(self):
-        """Create isolated scope for each test."""
-        self.test_scope = DependencyScope()
-
-        self.mock_email_service = MockEmailService()
-        self.mock_database = MockDatabase()
-
-        # Register test dependencies in isolated scope
-        self.test_scope.register_value(EmailServiceProtocol, self.mock_email_service)
-        self.test_scope.register_value(DatabaseProtocol, self.mock_database)
-
-    def create_user_service(self) -> UserService:
-        """Create UserService with test dependencies."""
-        # Create service within scope context
-        return UserService()
-
     def test_email_failure_handling(self):
         """Test handling of email service failure."""
         # Configure mock to fail
@@ -165,10 +156,17 @@ class TestUserServiceWithScopedIsolation:
 class MockEmailService:
     """Mock email service for testing."""
 
+    __slots__ = ("sent_emails", "should_fail")
+
     def __init__(self):
         self.sent_emails = []
         self.should_fail = False
 
+    def reset(self) -> None:
+        """Forget recorded emails so the mock can be shared between tests."""
+        self.sent_emails.clear()
+        self.should_fail = False
+
     def send_email(self, to: str, subject: str, body: str) -> bool:
         if self.should_fail:
             return False
@@ -180,23 +178,67 @@ class MockEmailService:
 class MockDatabase:
     """Mock database for testing."""
 
+    __slots__ = ("executed_queries", "query_results")
+
     def __init__(self):
         self.executed_queries = []
         self.query_results = []
 
-    def query(self, sql: str) -> list[dict]:
-        self.executed_queries.append(sql)
-
-        if self.query_results:
-            return self.query_results
+    def reset(self) -> None:
+        """Forget recorded queries so the mock can be shared between tests."""
+        self.executed_queries.clear()
+        self.query_results.clear()
 
-        # Default responses based on query type
+    def query(self, sql: str) -> list[dict]:
+        # Categorize once; tests assert on the category instead of re-scanning the SQL
         if "COUNT(*)" in sql:
-            return [{"count": 5}]
+            category, default_results = "count", [{"count": 5}]
         elif "INSERT" in sql:
-            return [{"id": 1}]
+            category, default_results = "insert", [{"id": 1}]
         else:
-            return [{"id": 1, "name": "Mock User"}]
+            category, default_results = "select", [{"id": 1, "name": "Mock User"}]
+        self.executed_queries.append((sql, category))
+
+        return self.query_results or default_results
+
+
+# === Testing with unittest.mock ===
+
+
+def test_with_spec_mocks():
+    """Use Mock(spec=...) instead of hand-written fakes when only calls need checking."""
+    email_service = Mock(spec=EmailServiceProtocol)
+    email_service.send_email.return_value = True
+    database = Mock(spec=DatabaseProtocol)
+
+    scope = DependencyScope()
+    scope.register_value(EmailServiceProtocol, email_service)
+    scope.register_value(DatabaseProtocol, database)
+
+    with scope:
+        result = UserService().register_user("mock@example.com", "Mock Test")
+
+    assert result["email_sent"] is True
+    email_service.send_email.assert_called_once_with(
+        to="mock@example.com", subject="Welcome!", body="Hello Mock Test, welcome to our service!"
+    )
+    assert len(database.query.call_args_list) == 1
+
+
+def test_spec_mock_email_failure():
+    """Simulate a failing email service with return_value instead of a flag."""
+    email_service = Mock(spec=EmailServiceProtocol)
+    email_service.send_email.return_value = False
+
+    scope = DependencyScope()
+    scope.register_value(EmailServiceProtocol, email_service)
+    scope.register_value(DatabaseProtocol, Mock(spec=DatabaseProtocol))
+
+    with scope:
+        result = UserService().register_user("mock@example.com", "Mock Test")
+
+    assert result["email_sent"] is False
+    email_service.send_email.assert_called_once()
 
 
 # === Integration Test Example ===
@@ -224,18 +266,25 @@ def test_integration_with_real_dependencies():
 # === Fixture-based Testing Pattern ===
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_email_service():
-    """Pytest fixture for mock email service."""
+    """Pytest fixture for mock email service, built once per module."""
     return MockEmailService()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_database():
-    """Pytest fixture for mock database."""
+    """Pytest fixture for mock database, built once per module."""
     return MockDatabase()
 
 
+@pytest.fixture(autouse=True)
+def reset_mocks(mock_email_service, mock_database):
+    """Reset the shared mocks before every test."""
+    mock_email_service.reset()
+    mock_database.reset()
+
+
 @pytest.fixture
 def test_scope(mock_email_service, mock_database):
     """Pytest fixture for test scope with mocks."""
@@ -274,14 +323,18 @@ def main():
     test_class2.test_email_failure_handling()
     print("✓ Email failure test passed")
 
-    print("\n3. Integration Test:")
+    print("\n3. Test with unittest.mock:")
+    test_with_spec_mocks()
+    print("✓ Mock(spec=...) test passed")
+
+    print("\n4. Integration Test:")
     test_integration_with_real_dependencies()
     print("✓ Integration test completed")
 
     print("\n" + "=" * 40)
     print("Key Testing Principles:")
     print("- Use isolated scopes for unit tests")
-    print("- Mock external dependencies")
+    print("- Mock external dependencies (Mock(spec=...) or hand-written fakes)")
     print("- Test both success and failure cases")
     print("- Use fixtures for reusable test setup")
     print("- Leverage scope context managers for clean isolation")
@@ -28,6 +28,7 @@ Basic Usage:
 Components:
     inject: Decorator for enabling dependency injection on functions
     Inject: Type-safe marker for injectable parameters
+    InjectLazy: Marker for dependencies resolved on first use
     DependencyScope: Thread-safe dependency scope with context manager
     dependency_scope: Convenience function for creating scopes
 """
@@ -47,7 +48,7 @@ from .exceptions import (
     StoreOperationError,
 )
 from .inject import ainject, inject
-from .models.inject import Inject
+from .models.inject import Inject, InjectLazy
 from .scope import (
     DependencyScope,
     clear_scope_stack,
@@ -61,6 +62,7 @@ __all__ = [
     "inject",
     "ainject",
     "Inject",
+    "InjectLazy",
     "DependencyScope",
     "dependency_scope",
     "resolve_dependency",
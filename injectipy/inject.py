@@ -2,78 +2,143 @@ import asyncio
 import functools
 import inspect
 from collections.abc import Awaitable, Callable
-from typing import TYPE_CHECKING, Any, TypeVar, cast
+from typing import Any, TypeVar, cast
 
 from injectipy.exceptions import AsyncDependencyError, DependencyNotFoundError, PositionalOnlyInjectionError
-from injectipy.models.inject import Inject
+from injectipy.models.inject import Inject, InjectLazy
+from injectipy.scope import (
+    DependencyScope,
+    _find_dependency_scope,
+    _raise_dependency_not_found,
+    _resolve_dependency_for_await,
+    get_active_scopes,
+    resolve_dependency,
+)
 
 F = TypeVar("F", bound=Callable[..., Any])
 AsyncF = TypeVar("AsyncF", bound=Callable[..., Awaitable[Any]])
 
-if TYPE_CHECKING:
-    from injectipy.scope import DependencyScope
+_POSITIONAL_ONLY = inspect.Parameter.POSITIONAL_ONLY
+# Parameter kinds that can receive a positional default
+_POSITIONAL_KINDS = frozenset((_POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD))
 
 
-def _check_for_async_dependency(
+def _resolve_with_async_check(
     inject_key: Any,
     param_name: str,
     function_name: str,
-    module_name: str | None = None,
-    explicit_scopes: list["DependencyScope"] | None = None,
-) -> None:
-    """Check if dependency key corresponds to an async resolver and raise error if used with @inject."""
-    from injectipy.scope import get_active_scopes
-
-    # Check explicit scopes first
-    if explicit_scopes:
-        for scope in reversed(explicit_scopes):
-            if scope.contains(inject_key):
-                if scope._is_async_resolver(inject_key):
-                    raise AsyncDependencyError(
-                        function_name=function_name,
-                        parameter_name=param_name,
-                        dependency_key=inject_key,
-                        module_name=module_name,
-                    )
-                return  # Found in explicit scope, no need to check active scopes
-
-    # Check active scopes for async resolvers
-    active_scopes = get_active_scopes()
-    for scope in reversed(active_scopes):  # Check innermost first
-        if scope.contains(inject_key):
-            if scope._is_async_resolver(inject_key):
-                raise AsyncDependencyError(
-                    function_name=function_name,
-                    parameter_name=param_name,
-                    dependency_key=inject_key,
-                    module_name=module_name,
-                )
-            break  # Found in this scope, no need to check others
+    module_name: str | None,
+    explicit_scopes: list[DependencyScope] | None,
+) -> Any:
+    """Resolve a dependency for @inject, rejecting async resolvers.
 
+    The providing scope is located once and used both for the async check and
+    for the resolution itself.
+    """
+    scope = _find_dependency_scope(inject_key, explicit_scopes)
+    if scope is None:
+        _raise_dependency_not_found(inject_key, explicit_scopes)
+
+    # Async dependencies are not allowed with @inject
+    if scope._is_async_resolver(inject_key):
+        raise AsyncDependencyError(
+            function_name=function_name,
+            parameter_name=param_name,
+            dependency_key=inject_key,
+            module_name=module_name,
+        )
+    return scope[inject_key]
 
-def _resolve_with_async_check(
+
+def _resolve_parameter(
     inject_key: Any,
     param_name: str,
     function_name: str,
     module_name: str | None,
-    explicit_scopes: list["DependencyScope"] | None,
+    explicit_scopes: list[DependencyScope] | None,
+    *,
+    allow_async: bool = False,
 ) -> Any:
-    """Helper to resolve dependency with async check to reduce code duplication."""
-    # Check if this is an async dependency - not allowed with @inject
-    _check_for_async_dependency(
-        inject_key=inject_key,
-        param_name=param_name,
+    """Resolve the dependency for one injected parameter, reporting failures against that parameter."""
+    try:
+        if allow_async:
+            return resolve_dependency(inject_key, explicit_scopes)
+        return _resolve_with_async_check(
+            inject_key=inject_key,
+            param_name=param_name,
+            function_name=function_name,
+            module_name=module_name,
+            explicit_scopes=explicit_scopes,
+        )
+    except DependencyNotFoundError as e:
+        raise _parameter_not_found(e, inject_key, param_name, function_name, module_name) from e
+
+
+def _parameter_not_found(
+    error: DependencyNotFoundError,
+    inject_key: Any,
+    param_name: str,
+    function_name: str,
+    module_name: str | None,
+) -> DependencyNotFoundError:
+    """Build a DependencyNotFoundError that reports the injected parameter it failed for."""
+    return DependencyNotFoundError(
+        key=inject_key,
         function_name=function_name,
         module_name=module_name,
-        explicit_scopes=explicit_scopes,
+        parameter_name=param_name,
+        available_keys=error.available_keys,
     )
 
-    from injectipy.scope import resolve_dependency
 
-    return resolve_dependency(inject_key, explicit_scopes)
+_UNRESOLVED: Any = object()
+
+
+class _LazyDependency:
+    """Deferred dependency injected for InjectLazy[key] parameters.
+
+    Calling the object resolves the dependency on first use and returns the
+    cached result on subsequent calls.
+    """
+
+    __slots__ = ("_resolve", "_value")
+
+    def __init__(self, resolve: Callable[[], Any]) -> None:
+        self._resolve = resolve
+        self._value = _UNRESOLVED
+
+    def __call__(self) -> Any:
+        if self._value is _UNRESOLVED:
+            self._value = self._resolve()
+        return self._value
 
 
-def inject(fn: F | None = None, *, scopes: list["DependencyScope"] | None = None) -> F | Callable[[F], F]:
+def _make_lazy_dependency(
+    inject_key: Any,
+    param_name: str,
+    function_name: str,
+    module_name: str | None,
+    explicit_scopes: list[DependencyScope] | None,
+    *,
+    allow_async: bool = False,
+) -> _LazyDependency:
+    """Create a lazy dependency bound to the scopes active at call time."""
+    # Explicit scopes come last so they keep the highest priority
+    pinned_scopes = get_active_scopes() + (explicit_scopes or [])
+    return _LazyDependency(
+        functools.partial(
+            _resolve_parameter,
+            inject_key,
+            param_name,
+            function_name,
+            module_name,
+            pinned_scopes,
+            allow_async=allow_async,
+        )
+    )
+
+
+def inject(fn: F | None = None, *, scopes: list[DependencyScope] | None = None) -> F | Callable[[F], F]:
     """Decorator to enable automatic dependency injection for function parameters.
 
     This decorator scans function parameters for Inject[key] annotations and
@@ -89,6 +154,9 @@ def inject(fn: F | None = None, *, scopes: list["DependencyScope"] | None = None
 
     Works with regular parameters, keyword-only parameters, classmethod and staticmethod.
 
+    Parameters with an InjectLazy[key] default receive a zero-argument callable
+    instead, which resolves the dependency on first call and caches it.
+
     Args:
         fn: The function, classmethod, or staticmethod to decorate
         scopes: Optional list of explicit scopes to use for dependency resolution
@@ -140,7 +208,81 @@ def inject(fn: F | None = None, *, scopes: list["DependencyScope"] | None = None
         return decorator(fn)
 
 
-def _create_injected_function(fn: F, explicit_scopes: list["DependencyScope"] | None = None) -> F:
+def _build_injection_plan(
+    func: Callable[..., Any],
+    defaults: tuple[Any, ...] | None,
+    kwdefaults: dict[str, Any] | None,
+) -> tuple[tuple[int | None, str, Any, bool, bool], ...]:
+    """Compute the injectable parameters of a function once, at decoration time.
+
+    Returns:
+        A tuple of ``(position, param_name, inject_key, positional_only, lazy)`` entries.
+        ``position`` is the index of the parameter among the positional parameters,
+        or None for keyword-only parameters.
+    """
+    plan: list[tuple[int | None, str, Any, bool, bool]] = []
+
+    if defaults and any(isinstance(default, Inject) for default in defaults):
+        positional_params = [p for p in inspect.signature(func).parameters.values() if p.kind in _POSITIONAL_KINDS]
+        first_default_position = len(positional_params) - len(defaults)
+        for offset, (param, default) in enumerate(zip(positional_params[-len(defaults) :], defaults, strict=False)):
+            if isinstance(default, Inject):
+                plan.append(
+                    (
+                        first_default_position + offset,
+                        param.name,
+                        default.get_inject_key(),
+                        param.kind == _POSITIONAL_ONLY,
+                        isinstance(default, InjectLazy),
+                    )
+                )
+
+    if kwdefaults:
+        for param_name, default in kwdefaults.items():
+            if isinstance(default, Inject):
+                plan.append((None, param_name, default.get_inject_key(), False, isinstance(default, InjectLazy)))
+
+    return tuple(plan)
+
+
+def _build_argument_check(func: Callable[..., Any]) -> Callable[[tuple[Any, ...], dict[str, Any]], None]:
+    """Build a cheap check that rejects invalid call arguments before any dependency is resolved.
+
+    Without it, a missing dependency would be reported ahead of the TypeError for
+    too many positional arguments or an unknown or duplicate keyword argument.
+    """
+    signature = inspect.signature(func)
+    parameters = signature.parameters.values()
+    max_positional: int | None = sum(1 for p in parameters if p.kind in _POSITIONAL_KINDS)
+    if any(p.kind == inspect.Parameter.VAR_POSITIONAL for p in parameters):
+        max_positional = None
+    accepts_var_keyword = any(p.kind == inspect.Parameter.VAR_KEYWORD for p in parameters)
+    # Position of each parameter that can be passed by keyword; None for keyword-only parameters
+    keyword_positions: dict[str, int | None] = {}
+    for position, param in enumerate(parameters):
+        if param.kind == inspect.Parameter.POSITIONAL_OR_KEYWORD:
+            keyword_positions[param.name] = position
+        elif param.kind == inspect.Parameter.KEYWORD_ONLY:
+            keyword_positions[param.name] = None
+
+    def check_arguments(args: tuple[Any, ...], kwargs: dict[str, Any]) -> None:
+        num_args = len(args)
+        if max_positional is not None and num_args > max_positional:
+            # Let inspect raise the same TypeError Python would
+            signature.bind_partial(*args, **kwargs)
+        for name in kwargs:
+            if name in keyword_positions:
+                position = keyword_positions[name]
+                if position is None or position >= num_args:
+                    continue
+            elif accepts_var_keyword:
+                continue
+            signature.bind_partial(*args, **kwargs)
+
+    return check_arguments
+
+
+def _create_injected_function(fn: F, explicit_scopes: list[DependencyScope] | None = None) -> F:
     """Create the actual injected function implementation."""
     is_classmethod = isinstance(fn, classmethod)
     is_staticmethod = isinstance(fn, staticmethod)
@@ -154,87 +296,41 @@ def _create_injected_function(fn: F, explicit_scopes: list["DependencyScope"] |
         original_defaults = getattr(fn, "__defaults__", None)
         original_kwdefaults = getattr(fn, "__kwdefaults__", None)
 
-    has_inject_defaults = False
+    injection_plan = _build_injection_plan(original_func, original_defaults, original_kwdefaults)
 
-    if original_defaults:
-        has_inject_defaults = any(isinstance(default, Inject) for default in original_defaults)
-
-    if original_kwdefaults:
-        has_inject_defaults = has_inject_defaults or any(
-            isinstance(default, Inject) for default in original_kwdefaults.values()
-        )
-
-    if not has_inject_defaults:
+    if not injection_plan:
         return fn
 
+    check_arguments = _build_argument_check(original_func)
+    function_name = original_func.__name__
+    module_name = getattr(original_func, "__module__", None)
+
     @functools.wraps(original_func)
     def wrapper(*args: Any, **kwargs: Any) -> Any:
+        check_arguments(args, kwargs)
         resolved_kwargs = kwargs.copy()
-        sig = inspect.signature(original_func)
-        bound_args = sig.bind_partial(*args, **kwargs)
-
-        if original_defaults:
-            param_list = list(sig.parameters.values())
-            regular_params = [
-                p
-                for p in param_list
-                if p.kind in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
-            ]
-            params_with_defaults = regular_params[-len(original_defaults) :]
-
-            for param, default in zip(params_with_defaults, original_defaults, strict=False):
-                if isinstance(default, Inject):
-                    if param.name not in bound_args.arguments:
-                        inject_key = default.get_inject_key()
-                        try:
-                            resolved_value = _resolve_with_async_check(
-                                inject_key=inject_key,
-                                param_name=param.name,
-                                function_name=original_func.__name__,
-                                module_name=getattr(original_func, "__module__", None),
-                                explicit_scopes=explicit_scopes,
-                            )
-
-                            if param.kind == inspect.Parameter.POSITIONAL_ONLY:
-                                raise PositionalOnlyInjectionError(
-                                    function_name=original_func.__name__,
-                                    parameter_name=param.name,
-                                    dependency_key=inject_key,
-                                    module_name=getattr(original_func, "__module__", None),
-                                )
-                            else:
-                                resolved_kwargs[param.name] = resolved_value
-                        except DependencyNotFoundError as e:
-                            raise DependencyNotFoundError(
-                                key=inject_key,
-                                function_name=original_func.__name__,
-                                module_name=getattr(original_func, "__module__", None),
-                                parameter_name=param.name,
-                                available_keys=e.available_keys,
-                            ) from e
-
-        if original_kwdefaults:
-            for param_name, default in original_kwdefaults.items():
-                if isinstance(default, Inject):
-                    if param_name not in resolved_kwargs:
-                        inject_key = default.get_inject_key()
-                        try:
-                            resolved_value = _resolve_with_async_check(
-                                inject_key=inject_key,
-                                param_name=param_name,
-                                function_name=original_func.__name__,
-                                module_name=getattr(original_func, "__module__", None),
-                                explicit_scopes=explicit_scopes,
-                            )
-                            resolved_kwargs[param_name] = resolved_value
-                        except DependencyNotFoundError as e:
-                            raise DependencyNotFoundError(
-                                key=inject_key,
-                                function_name=original_func.__name__,
-                                module_name=getattr(original_func, "__module__", None),
-                                parameter_name=param_name,
-                                available_keys=e.available_keys,
-                            ) from e
+        num_args = len(args)
+
+        for position, param_name, inject_key, positional_only, lazy in injection_plan:
+            if position is not None and position < num_args:
+                continue
+            if not positional_only and param_name in kwargs:
+                continue
+            if lazy:
+                resolved_value = _make_lazy_dependency(
+                    inject_key, param_name, function_name, module_name, explicit_scopes
+                )
+            else:
+                resolved_value = _resolve_parameter(inject_key, param_name, function_name, module_name, explicit_scopes)
+
+            if positional_only:
+                raise PositionalOnlyInjectionError(
+                    function_name=function_name,
+                    parameter_name=param_name,
+                    dependency_key=inject_key,
+                    module_name=module_name,
+                )
+            resolved_kwargs[param_name] = resolved_value
 
         return original_func(*args, **resolved_kwargs)
 
@@ -247,7 +343,7 @@ def _create_injected_function(fn: F, explicit_scopes: list["DependencyScope"] |
 
 
 def ainject(
-    fn: AsyncF | None = None, *, scopes: list["DependencyScope"] | None = None
+    fn: AsyncF | None = None, *, scopes: list[DependencyScope] | None = None
 ) -> AsyncF | Callable[[AsyncF], AsyncF]:
     """Async decorator to enable automatic dependency injection for async function parameters.
 
@@ -320,7 +416,7 @@ def ainject(
         return decorator(fn)
 
 
-async def resolve_dependency_async(key: Any, additional_scopes: list["DependencyScope"] | None = None) -> Any:
+async def resolve_dependency_async(key: Any, additional_scopes: list[DependencyScope] | None = None) -> Any:
     """Async version of resolve_dependency that properly awaits async dependencies.
 
     Args:
@@ -333,8 +429,6 @@ async def resolve_dependency_async(key: Any, additional_scopes: list["Dependency
     Raises:
         DependencyNotFoundError: If dependency not found in any scope
     """
-    from injectipy.scope import resolve_dependency
-
     # First resolve the dependency (may be sync value, Task, or other awaitable)
     resolved_value = resolve_dependency(key, additional_scopes)
 
@@ -345,7 +439,7 @@ async def resolve_dependency_async(key: Any, additional_scopes: list["Dependency
     return resolved_value
 
 
-def _create_async_injected_function(fn: AsyncF, explicit_scopes: list["DependencyScope"] | None = None) -> AsyncF:
+def _create_async_injected_function(fn: AsyncF, explicit_scopes: list[DependencyScope] | None = None) -> AsyncF:
     """Create the actual async injected function implementation."""
 
     # Validate that the function is actually async
@@ -364,76 +458,83 @@ def _create_async_injected_function(fn: AsyncF, explicit_scopes: list["Dependenc
         original_defaults = getattr(fn, "__defaults__", None)
         original_kwdefaults = getattr(fn, "__kwdefaults__", None)
 
-    has_inject_defaults = False
-
-    if original_defaults:
-        has_inject_defaults = any(isinstance(default, Inject) for default in original_defaults)
+    injection_plan = _build_injection_plan(original_func, original_defaults, original_kwdefaults)
 
-    if original_kwdefaults:
-        has_inject_defaults = has_inject_defaults or any(
-            isinstance(default, Inject) for default in original_kwdefaults.values()
-        )
-
-    if not has_inject_defaults:
+    if not injection_plan:
         return cast(AsyncF, fn)
 
+    check_arguments = _build_argument_check(original_func)
+    function_name = original_func.__name__
+    module_name = getattr(original_func, "__module__", None)
+
     @functools.wraps(original_func)
     async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+        check_arguments(args, kwargs)
         resolved_kwargs = kwargs.copy()
-        sig = inspect.signature(original_func)
-        bound_args = sig.bind_partial(*args, **kwargs)
-
-        # Resolve regular parameters with defaults
-        if original_defaults:
-            param_list = list(sig.parameters.values())
-            regular_params = [
-                p
-                for p in param_list
-                if p.kind in (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
-            ]
-            params_with_defaults = regular_params[-len(original_defaults) :]
-
-            for param, default in zip(params_with_defaults, original_defaults, strict=False):
-                if isinstance(default, Inject):
-                    if param.name not in bound_args.arguments:
-                        inject_key = default.get_inject_key()
-                        try:
-                            resolved_value = await resolve_dependency_async(inject_key, explicit_scopes)
-
-                            if param.kind == inspect.Parameter.POSITIONAL_ONLY:
-                                raise PositionalOnlyInjectionError(
-                                    function_name=original_func.__name__,
-                                    parameter_name=param.name,
-                                    dependency_key=inject_key,
-                                    module_name=getattr(original_func, "__module__", None),
-                                )
-                            else:
-                                resolved_kwargs[param.name] = resolved_value
-                        except DependencyNotFoundError as e:
-                            raise DependencyNotFoundError(
-                                key=inject_key,
-                                function_name=original_func.__name__,
-                                module_name=getattr(original_func, "__module__", None),
-                                parameter_name=param.name,
-                                available_keys=e.available_keys,
-                            ) from e
-
-        # Resolve keyword-only parameters
-        if original_kwdefaults:
-            for param_name, default in original_kwdefaults.items():
-                if isinstance(default, Inject):
-                    if param_name not in resolved_kwargs:
-                        inject_key = default.get_inject_key()
-                        try:
-                            resolved_kwargs[param_name] = await resolve_dependency_async(inject_key, explicit_scopes)
-                        except DependencyNotFoundError as e:
-                            raise DependencyNotFoundError(
-                                key=inject_key,
-                                function_name=original_func.__name__,
-                                module_name=getattr(original_func, "__module__", None),
-                                parameter_name=param_name,
-                                available_keys=e.available_keys,
-                            ) from e
+        num_args = len(args)
+
+        pending: list[tuple[str, Any, Any]] = []
+
+        try:
+            for position, param_name, inject_key, positional_only, lazy in injection_plan:
+                if position is not None and position < num_args:
+                    continue
+                if not positional_only and param_name in kwargs:
+                    continue
+                if lazy:
+                    resolved_value = _make_lazy_dependency(
+                        inject_key, param_name, function_name, module_name, explicit_scopes, allow_async=True
+                    )
+                else:
+                    try:
+                        resolved_value = _resolve_dependency_for_await(inject_key, explicit_scopes)
+                    except DependencyNotFoundError as e:
+                        raise _parameter_not_found(e, inject_key, param_name, function_name, module_name) from e
+
+                # Async dependencies are awaited after all parameters are resolved
+                is_pending = not lazy and hasattr(resolved_value, "__await__")
+                if is_pending:
+                    pending.append((param_name, inject_key, resolved_value))
+
+                if positional_only:
+                    raise PositionalOnlyInjectionError(
+                        function_name=function_name,
+                        parameter_name=param_name,
+                        dependency_key=inject_key,
+                        module_name=module_name,
+                    )
+                if not is_pending:
+                    resolved_kwargs[param_name] = resolved_value
+        except BaseException:
+            # Close bare coroutines that will never be awaited to avoid "never awaited" warnings
+            for _, _, awaitable in pending:
+                if inspect.iscoroutine(awaitable):
+                    awaitable.close()
+            raise
+
+        # Tasks created here for bare coroutines; shared evaluate_once awaitables are not ours to cancel
+        owned_tasks: list[asyncio.Future[Any]] = []
+        if len(pending) > 1:
+            # Schedule every async dependency before awaiting any, so they run concurrently
+            scheduled = []
+            for param_name, inject_key, awaitable in pending:
+                future = asyncio.ensure_future(awaitable)
+                if inspect.iscoroutine(awaitable):
+                    owned_tasks.append(future)
+                scheduled.append((param_name, inject_key, future))
+            pending = scheduled
+        try:
+            for param_name, inject_key, awaitable in pending:
+                try:
+                    resolved_kwargs[param_name] = await awaitable
+                except DependencyNotFoundError as e:
+                    raise _parameter_not_found(e, inject_key, param_name, function_name, module_name) from e
+        except BaseException:
+            # Cancel and reap the remaining tasks so none keeps running or logs an unretrieved exception
+            for task in owned_tasks:
+                task.cancel()
+            await asyncio.gather(*owned_tasks, return_exceptions=True)
+            raise
 
         # Call the original async function with resolved dependencies
         return await original_func(*args, **resolved_kwargs)
@@ -1,3 +1,3 @@
-from .inject import Inject
+from .inject import Inject, InjectLazy
 
-__all__ = ["Inject"]
+__all__ = ["Inject", "InjectLazy"]
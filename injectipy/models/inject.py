@@ -1,3 +1,5 @@
+import sys
+import weakref
 from typing import Any, Generic, TypeAlias, TypeVar
 
 T = TypeVar("T")
@@ -5,8 +7,28 @@ InjectKeyType: TypeAlias = str | type
 
 
 class _TypingMeta(type):
+    """Metaclass providing the Inject[key] syntax.
+
+    Markers are interned per (class, key) so that repeated Inject[key] references
+    share one object. Entries are weak so markers (and type keys) are freed once
+    no function default references them anymore.
+    """
+
+    _marker_cache: "weakref.WeakValueDictionary[tuple[type, Any], Any]" = weakref.WeakValueDictionary()
+
     def __getitem__(cls, item: Any) -> Any:
-        return cls(item)
+        if type(item) is str:
+            # Interned keys hash and compare by identity in the scope registries
+            item = sys.intern(item)
+        cache_key = (cls, item)
+        try:
+            marker = _TypingMeta._marker_cache.get(cache_key)
+        except TypeError:
+            # Unhashable keys cannot be interned
+            return cls(item)
+        if marker is None:
+            marker = _TypingMeta._marker_cache.setdefault(cache_key, cls(item))
+        return marker
 
 
 class _Inject(Generic[T]):
@@ -19,6 +41,9 @@ class _Inject(Generic[T]):
         inject_key: The key to use for dependency lookup (string or type)
     """
 
+    # __weakref__ lets interned markers live in the metaclass's WeakValueDictionary
+    __slots__ = ("_inject_key", "__weakref__")
+
     _inject_key: InjectKeyType
 
     def __init__(
@@ -68,7 +93,41 @@ class Inject(_Inject, metaclass=_TypingMeta):
         parameter type annotation.
     """
 
-    ...
+    __slots__ = ()
+
+
+class InjectLazy(Inject):
+    """Dependency injection marker for lazily resolved dependencies.
+
+    Instead of the dependency itself, @inject and @ainject pass a zero-argument
+    callable that resolves the dependency on first call and caches the result.
+    Resolution uses the scopes that were active when the decorated function
+    was called, so the dependency can be deferred until it is actually needed.
+
+    Example:
+        >>> class UserService:
+        ...     @inject
+        ...     def __init__(self, cache: Callable[[], Cache] = InjectLazy[Cache]):
+        ...         self._cache = cache
+        ...
+        ...     def get_user(self, user_id: str):
+        ...         return self._cache().get(user_id)  # Cache resolved on first use
+
+    Async resolvers:
+        With @ainject, calling the injected callable for an async resolver returns
+        an awaitable that must be awaited, for both plain and evaluate_once
+        resolvers: an asyncio.Task, or a future holding the result once an
+        evaluate_once resolver has already been awaited. The same awaitable is
+        returned on later calls. With @inject, async resolvers are still rejected,
+        but the AsyncDependencyError is raised on the first call of the injected
+        callable rather than when the function is called.
+
+    Note:
+        InjectLazy is only supported by the decorators; registering a resolver
+        with an InjectLazy parameter raises ParameterValidationError.
+    """
+
+    __slots__ = ()
 
 
-__all__ = ["Inject"]
+__all__ = ["Inject", "InjectLazy"]
@@ -3,56 +3,77 @@
 import asyncio
 import contextvars
 import inspect
+import sys
 import threading
-from collections.abc import Callable, Coroutine, Generator
+from collections.abc import Callable, Coroutine, Generator, Mapping
 from contextlib import contextmanager
-from dataclasses import dataclass
-from typing import Any, TypeAlias, TypeVar, overload
+from dataclasses import dataclass, field
+from typing import Any, NoReturn, TypeAlias, TypeVar, overload
 
 from injectipy.exceptions import (
     CircularDependencyError,
     DependencyNotFoundError,
     DuplicateRegistrationError,
     InvalidStoreOperationError,
+    ParameterValidationError,
 )
-from injectipy.models.inject import Inject
+from injectipy.models.inject import Inject, InjectLazy
 
 T = TypeVar("T")
 
 StoreKeyType: TypeAlias = str | type
 StoreResolverType: TypeAlias = Callable[..., Any]
 
-# Context variable for scope stack - works for both threads and async tasks
-_scope_stack: contextvars.ContextVar[list["DependencyScope"]] = contextvars.ContextVar(
-    "injectipy_scope_stack", default=[]
+# Context variable for scope stack - works for both threads and async tasks.
+# The stack is an immutable tuple, so readers can use it directly without copying.
+_scope_stack: contextvars.ContextVar[tuple["DependencyScope", ...]] = contextvars.ContextVar(
+    "injectipy_scope_stack", default=()
 )
 
+# Precomputed (param_name, dependency_key) pairs for a resolver's Inject parameters
+_ResolverPlanType: TypeAlias = tuple[tuple[str, StoreKeyType], ...]
 
-@dataclass(frozen=True)
+# Sentinel for single-probe dict lookups and unset caches, where None is a valid value
+_MISSING: Any = object()
+
+
+@dataclass(slots=True)
 class _StoreResolverWithArgs:
     resolver: StoreResolverType
     evaluate_once: bool
+    inject_plan: _ResolverPlanType = ()
+    cached_result: Any = field(default=_MISSING, compare=False, repr=False)  # Set by evaluate_once
 
 
-@dataclass(frozen=True)
+@dataclass(slots=True)
 class _AsyncStoreResolverWithArgs:
     async_resolver: Callable[..., Coroutine[Any, Any, Any]]
     evaluate_once: bool
     sync_wrapper: StoreResolverType  # The sync wrapper function
+    inject_plan: _ResolverPlanType = ()
+    cached_result: Any = field(default=_MISSING, compare=False, repr=False)  # Set by evaluate_once
 
 
 _StoreValueType = _StoreResolverWithArgs | _AsyncStoreResolverWithArgs | Any
 
+# Registry entries that are resolved by calling a function; anything else is a plain value
+_RESOLVER_ENTRY_TYPES = (_StoreResolverWithArgs, _AsyncStoreResolverWithArgs)
+
 
-def _get_scope_stack() -> list["DependencyScope"]:
+def _intern_key(key: StoreKeyType) -> StoreKeyType:
+    """Intern string keys so lookups with Inject markers (also interned) match by identity."""
+    return sys.intern(key) if type(key) is str else key
+
+
+def _get_scope_stack() -> tuple["DependencyScope", ...]:
     """Get the current scope stack from context variables.
 
     This works correctly for both threading and asyncio contexts.
     """
-    return _scope_stack.get().copy()
+    return _scope_stack.get()
 
 
-def _set_scope_stack(stack: list["DependencyScope"]) -> None:
+def _set_scope_stack(stack: tuple["DependencyScope", ...]) -> None:
     """Set the scope stack in the current context."""
     _scope_stack.set(stack)
 
@@ -85,9 +106,8 @@ class DependencyScope:
 
     def __init__(self) -> None:
         """Initialize a new dependency scope."""
+        # Single store for values and resolver entries; evaluate_once results are kept on the entry
         self._registry: dict[StoreKeyType, _StoreValueType] = {}
-        self._cache: dict[StoreKeyType, Any] = {}
-        self._async_resolver_cache: dict[StoreKeyType, bool] = {}  # Cache for async resolver lookups
         self._registry_lock = threading.RLock()
         self._active = False
 
@@ -104,11 +124,32 @@ class DependencyScope:
         Raises:
             DuplicateRegistrationError: If key already exists in this scope
         """
+        key = _intern_key(key)
         with self._registry_lock:
             self._raise_if_key_already_registered(key)
             self._registry[key] = value
-            self._cache[key] = value
-            self._async_resolver_cache[key] = False  # Values are not async resolvers
+        return self
+
+    def register_values(self, values: Mapping[StoreKeyType, Any]) -> "DependencyScope":
+        """Register several static values in this scope at once.
+
+        The registration is atomic: if any key is already registered, no value
+        from the mapping is registered.
+
+        Args:
+            values: Mapping of dependency keys to values
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            DuplicateRegistrationError: If any key already exists in this scope
+        """
+        interned_values = {_intern_key(key): value for key, value in values.items()}
+        with self._registry_lock:
+            for key in interned_values:
+                self._raise_if_key_already_registered(key)
+            self._registry.update(interned_values)
         return self
 
     def register_resolver(
@@ -127,12 +168,14 @@ class DependencyScope:
         Raises:
             DuplicateRegistrationError: If key already exists in this scope
             CircularDependencyError: If circular dependency detected
+            ParameterValidationError: If a resolver parameter uses InjectLazy
         """
+        key = _intern_key(key)
         with self._registry_lock:
             self._raise_if_key_already_registered(key)
-            self._check_circular_dependencies(key, resolver)
-            self._registry[key] = _StoreResolverWithArgs(resolver, evaluate_once)
-            self._async_resolver_cache[key] = False  # Sync resolvers are not async
+            inject_plan = self._build_resolver_plan(key, resolver)
+            self._check_circular_dependencies(key, inject_plan)
+            self._registry[key] = _StoreResolverWithArgs(resolver, evaluate_once, inject_plan)
         return self
 
     def register_async_resolver(
@@ -151,6 +194,7 @@ class DependencyScope:
         Raises:
             DuplicateRegistrationError: If key already exists in this scope
             CircularDependencyError: If circular dependency detected
+            ParameterValidationError: If a resolver parameter uses InjectLazy
         """
 
         def sync_wrapper(*args: Any, **kwargs: Any) -> Any:
@@ -167,18 +211,19 @@ class DependencyScope:
                 # If not in async context, run it synchronously
                 return asyncio.run(async_resolver(*args, **kwargs))
 
+        key = _intern_key(key)
         with self._registry_lock:
             self._raise_if_key_already_registered(key)
-            self._check_circular_dependencies(key, async_resolver)
+            inject_plan = self._build_resolver_plan(key, async_resolver)
+            self._check_circular_dependencies(key, inject_plan)
             # Store as an async resolver with a special marker
-            self._registry[key] = _AsyncStoreResolverWithArgs(async_resolver, evaluate_once, sync_wrapper)
-            self._async_resolver_cache[key] = True  # Cache that this is an async resolver
+            self._registry[key] = _AsyncStoreResolverWithArgs(async_resolver, evaluate_once, sync_wrapper, inject_plan)
         return self
 
     def _raise_if_key_already_registered(self, key: StoreKeyType) -> None:
-        if key in self._registry:
+        existing_entry = self._registry.get(key, _MISSING)
+        if existing_entry is not _MISSING:
             # Determine the type of existing registration
-            existing_entry = self._registry[key]
             if isinstance(existing_entry, _StoreResolverWithArgs):
                 existing_type = "resolver"
             elif isinstance(existing_entry, _AsyncStoreResolverWithArgs):
@@ -187,81 +232,76 @@ class DependencyScope:
                 existing_type = "value"
             raise DuplicateRegistrationError(key, existing_type=existing_type)
 
-    def _check_circular_dependencies(
-        self, new_key: StoreKeyType, new_resolver: StoreResolverType | Callable[..., Coroutine[Any, Any, Any]]
-    ) -> None:
-        new_dependencies = self._get_resolver_dependencies(new_resolver)
-
-        for dep_key in new_dependencies:
-            if self._has_dependency_path(dep_key, new_key, set()):
-                dependency_chain = self._build_dependency_chain(dep_key, new_key, [])
+    def _check_circular_dependencies(self, new_key: StoreKeyType, new_plan: _ResolverPlanType) -> None:
+        visited: set[StoreKeyType] = set()
+        for dep_key in {dep_key for _, dep_key in new_plan}:
+            if self._has_dependency_path(dep_key, new_key, visited):
+                dependency_chain = self._build_dependency_chain(dep_key, new_key)
                 raise CircularDependencyError(
                     dependency_chain=dependency_chain, new_key=new_key, conflicting_key=dep_key
                 )
 
-    def _get_resolver_dependencies(
-        self, resolver: StoreResolverType | Callable[..., Coroutine[Any, Any, Any]]
-    ) -> set[StoreKeyType]:
-        dependencies = set()
-        resolver_signature = inspect.signature(resolver)
-
-        for param in resolver_signature.parameters.values():
-            if param.default is not inspect.Parameter.empty and isinstance(param.default, Inject):
-                dependencies.add(param.default.get_inject_key())
+    @staticmethod
+    def _build_resolver_plan(
+        key: StoreKeyType, resolver: StoreResolverType | Callable[..., Coroutine[Any, Any, Any]]
+    ) -> _ResolverPlanType:
+        """Introspect a resolver once, at registration time, for its Inject parameters.
 
-        return dependencies
+        Raises:
+            ParameterValidationError: If a parameter uses InjectLazy, which resolvers do not support
+        """
+        resolver_signature = inspect.signature(resolver)
+        inject_plan = []
+        for param_name, param in resolver_signature.parameters.items():
+            if isinstance(param.default, InjectLazy):
+                raise ParameterValidationError(key, param_name, "InjectLazy")
+            if isinstance(param.default, Inject):
+                inject_plan.append((param_name, param.default.get_inject_key()))
+        return tuple(inject_plan)
+
+    def _get_resolver_dependencies(self, key: StoreKeyType) -> set[StoreKeyType]:
+        registry_entry = self._registry.get(key)
+        if isinstance(registry_entry, _RESOLVER_ENTRY_TYPES):
+            return {dep_key for _, dep_key in registry_entry.inject_plan}
+        return set()
 
     def _has_dependency_path(self, from_key: StoreKeyType, to_key: StoreKeyType, visited: set[StoreKeyType]) -> bool:
-        if from_key == to_key:
-            return True
-
-        if from_key in visited:
-            return False
-
-        if from_key not in self._registry:
-            return False
-
-        visited.add(from_key)
-        registry_entry = self._registry[from_key]
-        if isinstance(registry_entry, _StoreResolverWithArgs):
-            dependencies = self._get_resolver_dependencies(registry_entry.resolver)
-            for dep_key in dependencies:
-                if self._has_dependency_path(dep_key, to_key, visited.copy()):
-                    return True
-        elif isinstance(registry_entry, _AsyncStoreResolverWithArgs):
-            dependencies = self._get_resolver_dependencies(registry_entry.async_resolver)
-            for dep_key in dependencies:
-                if self._has_dependency_path(dep_key, to_key, visited.copy()):
-                    return True
+        # Iterative DFS; keys in visited are known not to reach to_key, so callers may
+        # share one visited set across several searches for the same target
+        stack = [from_key]
+        while stack:
+            key = stack.pop()
+            if key == to_key:
+                return True
+            if key in visited:
+                continue
+            visited.add(key)
+            registry_entry = self._registry.get(key)
+            if isinstance(registry_entry, _RESOLVER_ENTRY_TYPES):
+                stack.extend(dep_key for _, dep_key in registry_entry.inject_plan)
 
         return False
 
-    def _build_dependency_chain(
-        self, from_key: StoreKeyType, to_key: StoreKeyType, current_chain: list[StoreKeyType]
-    ) -> list[StoreKeyType]:
-        if from_key == to_key:
-            return current_chain + [from_key]
-
-        if from_key not in self._registry:
-            return current_chain + [from_key]
-
-        registry_entry = self._registry[from_key]
-        if isinstance(registry_entry, _StoreResolverWithArgs):
-            dependencies = self._get_resolver_dependencies(registry_entry.resolver)
-            for dep_key in dependencies:
-                if dep_key not in current_chain:
-                    chain = self._build_dependency_chain(dep_key, to_key, current_chain + [from_key])
-                    if chain and chain[-1] == to_key:
-                        return chain
-        elif isinstance(registry_entry, _AsyncStoreResolverWithArgs):
-            dependencies = self._get_resolver_dependencies(registry_entry.async_resolver)
-            for dep_key in dependencies:
-                if dep_key not in current_chain:
-                    chain = self._build_dependency_chain(dep_key, to_key, current_chain + [from_key])
-                    if chain and chain[-1] == to_key:
-                        return chain
-
-        return current_chain + [from_key]
+    def _build_dependency_chain(self, from_key: StoreKeyType, to_key: StoreKeyType) -> list[StoreKeyType]:
+        # Iterative DFS recording each key's predecessor, so the path can be rebuilt
+        # without recursing along long dependency chains
+        predecessors: dict[StoreKeyType, Any] = {from_key: _MISSING}
+        stack = [from_key]
+        while stack:
+            key = stack.pop()
+            if key == to_key:
+                chain: list[StoreKeyType] = []
+                while key is not _MISSING:
+                    chain.append(key)
+                    key = predecessors[key]
+                chain.reverse()
+                return chain
+            for dep_key in self._get_resolver_dependencies(key):
+                if dep_key not in predecessors:
+                    predecessors[dep_key] = key
+                    stack.append(dep_key)
+
+        return [from_key]
 
     @overload
     def __getitem__(self, key: str) -> Any:
@@ -283,47 +323,116 @@ class DependencyScope:
         Raises:
             DependencyNotFoundError: If key not found in this scope
         """
+        # Lock-free fast path: plain values and evaluate_once results are immutable once
+        # published, and a single dict.get is atomic, so they can be read without the lock
+        registry_entry = self._registry.get(key, _MISSING)
+        if registry_entry is not _MISSING:
+            # Entries are created only by this class, so a tuple membership test on the
+            # exact type suffices for plain values
+            if type(registry_entry) not in _RESOLVER_ENTRY_TYPES:
+                return registry_entry
+            if registry_entry.cached_result is not _MISSING:
+                return registry_entry.cached_result
+
         with self._registry_lock:
-            if key in self._cache:
-                return self._cache[key]
-            if key in self._registry:
-                value_or_resolver_with_args = self._registry[key]
-
-                result: Any
-                if isinstance(value_or_resolver_with_args, _StoreResolverWithArgs):
-                    resolver_with_args = value_or_resolver_with_args
-                    result = self._resolve(resolver_with_args.resolver)
-                    if resolver_with_args.evaluate_once:
-                        self._cache[key] = result
-                elif isinstance(value_or_resolver_with_args, _AsyncStoreResolverWithArgs):
-                    async_resolver_with_args = value_or_resolver_with_args
-                    result = self._resolve(async_resolver_with_args.sync_wrapper)
-                    if async_resolver_with_args.evaluate_once:
-                        self._cache[key] = result
-                else:
-                    result = value_or_resolver_with_args
-
-                return result
-            # Get available keys for suggestions
-            available_keys = list(self._registry.keys())
-            raise DependencyNotFoundError(key=key, available_keys=available_keys)
-
-    def _resolve(self, resolver: StoreResolverType) -> Any:
-        resolver_signature = inspect.signature(resolver)
-        resolver_parameters = resolver_signature.parameters
+            # Re-read under the lock; another thread may have registered or evaluated the entry
+            registry_entry = self._registry.get(key, _MISSING)
+            if registry_entry is _MISSING:
+                # Get available keys for suggestions
+                available_keys = list(self._registry.keys())
+                raise DependencyNotFoundError(key=key, available_keys=available_keys)
+            if type(registry_entry) not in _RESOLVER_ENTRY_TYPES:
+                return registry_entry
+            if registry_entry.cached_result is not _MISSING:
+                return registry_entry.cached_result
+
+            result: Any
+            if isinstance(registry_entry, _StoreResolverWithArgs):
+                result = self._resolve(registry_entry.resolver, registry_entry.inject_plan)
+            else:
+                # Async resolvers handle their own Inject parameters (e.g. via @ainject);
+                # the plan is only used for circular dependency detection.
+                result = registry_entry.sync_wrapper()
+            if registry_entry.evaluate_once:
+                registry_entry.cached_result = result
+            return result
+
+    def _resolve(self, resolver: StoreResolverType, inject_plan: _ResolverPlanType) -> Any:
+        if not inject_plan:
+            # Plain factories (including classes without Inject parameters) need no kwargs
+            return resolver()
+
         resolver_args: dict[str, Any] = {}
 
-        for param_name, param in resolver_parameters.items():
-            if param.default is not inspect.Parameter.empty and isinstance(param.default, Inject):
-                try:
-                    resolver_args[param_name] = resolve_dependency(param.default.get_inject_key())
-                except DependencyNotFoundError:
-                    # If the dependency is not found and param has no default, this will cause an error
-                    # Let the resolver handle missing dependencies by falling back to the Inject object
-                    pass
+        for param_name, dep_key in inject_plan:
+            try:
+                resolver_args[param_name] = resolve_dependency(dep_key)
+            except DependencyNotFoundError:
+                # If the dependency is not found and param has no default, this will cause an error
+                # Let the resolver handle missing dependencies by falling back to the Inject object
+                pass
 
         return resolver(**resolver_args)
 
+    def _resolve_for_await(self, key: StoreKeyType) -> Any:
+        """Get a dependency for a caller that awaits the result immediately.
+
+        Uncached async resolvers return their coroutine directly, skipping the Task
+        that __getitem__ schedules for callers that may never await it. Unevaluated
+        evaluate_once async resolvers return a coroutine that awaits the resolver
+        inline (see _await_evaluate_once); once evaluation has started, the shared
+        pending or resolved awaitable is returned.
+        """
+        with self._registry_lock:
+            registry_entry = self._registry.get(key)
+            if isinstance(registry_entry, _AsyncStoreResolverWithArgs):
+                if not registry_entry.evaluate_once:
+                    return registry_entry.async_resolver()
+                if registry_entry.cached_result is _MISSING:
+                    return self._await_evaluate_once(registry_entry)
+            return self[key]
+
+    async def _await_evaluate_once(self, registry_entry: _AsyncStoreResolverWithArgs) -> Any:
+        """Evaluate an evaluate_once async resolver in the awaiting task.
+
+        The entry moves from unresolved to pending when this coroutine starts, so a
+        coroutine that is closed without running leaves the entry untouched. While
+        pending, the entry caches a future that later awaiters share; it becomes the
+        resolved value's awaitable once the resolver returns. No Task is scheduled
+        for the common case of a single awaiter.
+        """
+        with self._registry_lock:
+            pending = registry_entry.cached_result
+            if pending is _MISSING:
+                future = asyncio.get_running_loop().create_future()
+                registry_entry.cached_result = future
+        if pending is not _MISSING:
+            # Evaluation already started elsewhere; shield it from this awaiter's cancellation
+            return await asyncio.shield(pending)
+
+        try:
+            result = await registry_entry.async_resolver()
+        except Exception as e:
+            # Cache the failure like a failed Task would be cached
+            if not future.done():
+                future.set_exception(e)
+                future.exception()  # Mark retrieved; waiters still receive the exception
+            raise
+        except BaseException:
+            # Cancelled before a result existed: back to unresolved so a later access retries
+            with self._registry_lock:
+                if registry_entry.cached_result is future:
+                    registry_entry.cached_result = _MISSING
+            future.cancel()
+            raise
+        with self._registry_lock:
+            if future.cancelled():
+                # A caller awaited the raw future from __getitem__ and was cancelled; publish anew
+                future = asyncio.get_running_loop().create_future()
+                registry_entry.cached_result = future
+            future.set_result(result)
+        return result
+
     def __setitem__(self, _key: Any, _value: Any) -> None:
         raise InvalidStoreOperationError(
             operation="direct assignment (scope[key] = value)",
@@ -336,22 +445,12 @@ class DependencyScope:
 
     def _is_async_resolver(self, key: StoreKeyType) -> bool:
         """Check if a key corresponds to an async resolver."""
-        with self._registry_lock:
-            # Use cache first for performance
-            if key in self._async_resolver_cache:
-                return self._async_resolver_cache[key]
-
-            # Fallback to registry check (shouldn't happen in normal cases)
-            if key in self._registry:
-                is_async = isinstance(self._registry[key], _AsyncStoreResolverWithArgs)
-                self._async_resolver_cache[key] = is_async  # Cache the result
-                return is_async
-            return False
+        return isinstance(self._registry.get(key), _AsyncStoreResolverWithArgs)
 
     def __enter__(self) -> "DependencyScope":
         """Sync context manager entry - works for both sync and async contexts."""
         stack = _get_scope_stack()
-        new_stack = stack + [self]
+        new_stack = stack + (self,)
         _set_scope_stack(new_stack)
         self._active = True
         return self
@@ -365,13 +464,11 @@ class DependencyScope:
         self._active = False
         with self._registry_lock:
             self._registry.clear()
-            self._cache.clear()
-            self._async_resolver_cache.clear()
 
     async def __aenter__(self) -> "DependencyScope":
         """Async context manager entry."""
         stack = _get_scope_stack()
-        new_stack = stack + [self]
+        new_stack = stack + (self,)
         _set_scope_stack(new_stack)
         self._active = True
         return self
@@ -386,50 +483,67 @@ class DependencyScope:
         # Use regular synchronous cleanup - registry operations are already thread-safe
         with self._registry_lock:
             self._registry.clear()
-            self._cache.clear()
-            self._async_resolver_cache.clear()
+
+    def preload(self) -> "DependencyScope":
+        """Eagerly evaluate every sync evaluate_once resolver in this scope.
+
+        Singletons are otherwise created on first access. Preloading moves that
+        work to a single point, typically right after entering the scope, so later
+        resolutions are plain lookups. Dependencies between singletons are resolved
+        recursively, so registration order does not matter. Async resolvers are
+        left lazy.
+
+        Returns:
+            Self for method chaining
+
+        Raises:
+            InvalidStoreOperationError: If the scope is not active in the current context
+        """
+        # Check the context's own scope stack: _active is shared across threads and tasks
+        if self not in _get_scope_stack():
+            raise InvalidStoreOperationError(
+                operation="preload()",
+                reason="The scope must be active so resolver dependencies can be resolved",
+            )
+        with self._registry_lock:
+            for key, registry_entry in list(self._registry.items()):
+                if isinstance(registry_entry, _StoreResolverWithArgs) and registry_entry.evaluate_once:
+                    self[key]
+        return self
 
     def is_active(self) -> bool:
         """Check if this scope is currently active."""
         return self._active
 
     def _reset_for_testing(self) -> None:
-        """Reset the scope state for testing purposes only."""
-        with self._registry_lock:
-            self._registry.clear()
-            self._cache.clear()
-            self._async_resolver_cache.clear()
-
-
-def resolve_dependency(key: StoreKeyType, additional_scopes: list[DependencyScope] | None = None) -> Any:
-    """Resolve a dependency from active scopes and additional scopes.
-
-    Dependencies are resolved in this order:
-    1. Additional scopes (if provided, last one wins)
-    2. Active scope stack (innermost scope wins)
+        """Reset the scope state for testing purposes only.
 
-    Args:
-        key: The dependency key to resolve
-        additional_scopes: Optional list of additional scopes to search
+        The registry is swapped for a fresh dict rather than cleared in place, so
+        lock-free readers observe either the old or the new registry, never a partial one.
+        """
+        with self._registry_lock:
+            self._registry = {}
 
-    Returns:
-        The resolved dependency value
 
-    Raises:
-        DependencyNotFoundError: If dependency not found in any scope
-    """
+def _find_dependency_scope(
+    key: StoreKeyType, additional_scopes: list[DependencyScope] | None = None
+) -> DependencyScope | None:
+    """Find the scope that provides a dependency, following resolve_dependency's priority order."""
     # Try additional scopes first (last one wins)
     if additional_scopes:
         for scope in reversed(additional_scopes):
             if scope.contains(key):
-                return scope[key]
+                return scope
 
     # Try active scope stack (innermost wins)
-    stack = _get_scope_stack()
-    for scope in reversed(stack):
+    for scope in reversed(_get_scope_stack()):
         if scope.contains(key):
-            return scope[key]
+            return scope
+
+    return None
+
 
+def _raise_dependency_not_found(key: StoreKeyType, additional_scopes: list[DependencyScope] | None) -> NoReturn:
     # Collect all available keys for better error messages
     available_keys: list[str] = []
 
@@ -439,12 +553,47 @@ def resolve_dependency(key: StoreKeyType, additional_scopes: list[DependencyScop
             available_keys.extend(str(k) for k in scope._registry.keys())
 
     # Collect from stack scopes
-    for scope in stack:
+    for scope in _get_scope_stack():
         available_keys.extend(str(k) for k in scope._registry.keys())
 
     raise DependencyNotFoundError(key=key, available_keys=list(set(available_keys)))
 
 
+def resolve_dependency(key: StoreKeyType, additional_scopes: list[DependencyScope] | None = None) -> Any:
+    """Resolve a dependency from active scopes and additional scopes.
+
+    Dependencies are resolved in this order:
+    1. Additional scopes (if provided, last one wins)
+    2. Active scope stack (innermost scope wins)
+
+    Args:
+        key: The dependency key to resolve
+        additional_scopes: Optional list of additional scopes to search
+
+    Returns:
+        The resolved dependency value
+
+    Raises:
+        DependencyNotFoundError: If dependency not found in any scope
+    """
+    scope = _find_dependency_scope(key, additional_scopes)
+    if scope is None:
+        _raise_dependency_not_found(key, additional_scopes)
+    return scope[key]
+
+
+def _resolve_dependency_for_await(key: StoreKeyType, additional_scopes: list[DependencyScope] | None = None) -> Any:
+    """Resolve a dependency for a caller that awaits awaitable results immediately.
+
+    Behaves like resolve_dependency, except that async resolvers without
+    evaluate_once return their bare coroutine instead of a scheduled Task.
+    """
+    scope = _find_dependency_scope(key, additional_scopes)
+    if scope is None:
+        _raise_dependency_not_found(key, additional_scopes)
+    return scope._resolve_for_await(key)
+
+
 @contextmanager
 def dependency_scope() -> Generator[DependencyScope, None, None]:
     """Create a new dependency scope context manager.
@@ -467,7 +616,7 @@ def get_active_scopes() -> list[DependencyScope]:
     Returns:
         List of active scopes from outermost to innermost
     """
-    return _get_scope_stack().copy()
+    return list(_get_scope_stack())
 
 
 def clear_scope_stack() -> None:
@@ -475,7 +624,7 @@ def clear_scope_stack() -> None:
 
     This is primarily for testing purposes to ensure clean state.
     """
-    _set_scope_stack([])
+    _set_scope_stack(())
 
 
 __all__ = [
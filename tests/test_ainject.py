@@ -1,12 +1,13 @@
 """Tests for the @ainject decorator."""
 
 import asyncio
+import gc
 from typing import Protocol
 
 import pytest
 
-from injectipy import DependencyScope, Inject, ainject, inject
-from injectipy.exceptions import DependencyNotFoundError, PositionalOnlyInjectionError
+from injectipy import DependencyScope, Inject, InjectLazy, ainject, inject
+from injectipy.exceptions import AsyncDependencyError, DependencyNotFoundError, PositionalOnlyInjectionError
 
 
 class AsyncApiClient(Protocol):
@@ -139,6 +140,17 @@ def test_ainject_explicit_args_override_injection(basic_scope):
     asyncio.run(run_test())
 
 
+def test_ainject_invalid_arguments_raise_type_error_before_resolution():
+    """Test that invalid call arguments take priority over a missing dependency."""
+
+    @ainject
+    async def func(a: str, missing: str = Inject["nonexistent"]) -> str:
+        return f"{a}, {missing}"
+
+    with pytest.raises(TypeError):
+        asyncio.run(func("x", unknown=1))
+
+
 def test_ainject_without_dependencies():
     """Test that ainject works on functions without injectable dependencies."""
 
@@ -360,3 +372,278 @@ def test_ainject_with_evaluate_once():
             assert creation_count == 1  # Only created once
 
     asyncio.run(run_test())
+
+
+def test_ainject_awaits_async_resolver_inline():
+    """Test that a single uncached async dependency is awaited in the caller's task."""
+    scope = DependencyScope()
+    resolver_tasks = []
+
+    async def create_client():
+        resolver_tasks.append(asyncio.current_task())
+        return {"client": "ready"}
+
+    scope.register_async_resolver("client", create_client)
+
+    @ainject
+    async def use_client(client: dict = Inject["client"]) -> dict:
+        return client
+
+    async def run_test():
+        async with scope:
+            result = await use_client()
+            assert result == {"client": "ready"}
+            assert resolver_tasks == [asyncio.current_task()]
+
+    asyncio.run(run_test())
+
+
+def test_ainject_runs_multiple_async_dependencies_concurrently():
+    """Test that several async dependencies of one function are resolved concurrently."""
+    scope = DependencyScope()
+    both_started = asyncio.Event()
+    started = 0
+
+    async def create_dependency():
+        nonlocal started
+        started += 1
+        if started == 2:
+            both_started.set()
+        await asyncio.wait_for(both_started.wait(), timeout=1)
+        return started
+
+    scope.register_async_resolver("first", create_dependency)
+    scope.register_async_resolver("second", create_dependency)
+
+    @ainject
+    async def use_both(first: int = Inject["first"], second: int = Inject["second"]) -> tuple:
+        return first, second
+
+    async def run_test():
+        async with scope:
+            assert await use_both() == (2, 2)
+
+    asyncio.run(run_test())
+
+
+@pytest.mark.parametrize("evaluate_once", [False, True])
+def test_ainject_lazy_async_dependency_returns_task(evaluate_once):
+    """Test that InjectLazy with an async resolver injects a callable returning an awaitable Task."""
+    scope = DependencyScope()
+    creation_count = 0
+
+    async def create_client():
+        nonlocal creation_count
+        creation_count += 1
+        await asyncio.sleep(0.01)
+        return {"client": creation_count}
+
+    scope.register_async_resolver("client", create_client, evaluate_once=evaluate_once)
+
+    @ainject
+    async def get_lazy_client(client=InjectLazy["client"]):
+        return client
+
+    async def run_test():
+        async with scope:
+            lazy_client = await get_lazy_client()
+            assert creation_count == 0
+
+            task = lazy_client()
+            assert isinstance(task, asyncio.Task)
+            assert lazy_client() is task
+            assert await task == {"client": 1}
+            assert await lazy_client() == {"client": 1}
+            assert creation_count == 1
+
+    asyncio.run(run_test())
+
+
+def test_inject_lazy_async_dependency_raises_on_first_call():
+    """Test that @inject defers the AsyncDependencyError for a lazy async dependency to its first call."""
+    scope = DependencyScope()
+
+    async def create_client():
+        return {"client": "ready"}
+
+    scope.register_async_resolver("client", create_client)
+
+    @inject
+    def get_lazy_client(client=InjectLazy["client"]):
+        return client
+
+    with scope:
+        lazy_client = get_lazy_client()
+        with pytest.raises(AsyncDependencyError):
+            lazy_client()
+
+
+def test_ainject_awaits_cold_evaluate_once_resolver_inline():
+    """Test that the first evaluation of an evaluate_once async resolver runs in the caller's task."""
+    scope = DependencyScope()
+    resolver_tasks = []
+
+    async def create_client():
+        resolver_tasks.append(asyncio.current_task())
+        return {"client": len(resolver_tasks)}
+
+    scope.register_async_resolver("client", create_client, evaluate_once=True)
+
+    @ainject
+    async def use_client(client: dict = Inject["client"]) -> dict:
+        return client
+
+    async def run_test():
+        async with scope:
+            assert await use_client() == {"client": 1}
+            assert await use_client() == {"client": 1}
+            assert resolver_tasks == [asyncio.current_task()]
+
+    asyncio.run(run_test())
+
+
+def test_ainject_concurrent_awaiters_share_pending_evaluate_once_resolution():
+    """Test that awaiters arriving while an evaluate_once resolver is pending share its evaluation."""
+    scope = DependencyScope()
+    creation_count = 0
+
+    async def create_client():
+        nonlocal creation_count
+        creation_count += 1
+        await asyncio.sleep(0.01)
+        return {"client": creation_count}
+
+    scope.register_async_resolver("client", create_client, evaluate_once=True)
+
+    @ainject
+    async def use_client(client: dict = Inject["client"]) -> dict:
+        return client
+
+    async def run_test():
+        async with scope:
+            results = await asyncio.gather(use_client(), use_client(), use_client())
+            assert results == [{"client": 1}] * 3
+            assert creation_count == 1
+
+    asyncio.run(run_test())
+
+
+def test_ainject_cancelled_evaluate_once_resolution_is_retried():
+    """Test that cancelling the first awaiter leaves an evaluate_once resolver unresolved."""
+    scope = DependencyScope()
+    creation_count = 0
+    started = asyncio.Event()
+
+    async def create_client():
+        nonlocal creation_count
+        creation_count += 1
+        if creation_count == 1:
+            started.set()
+            await asyncio.sleep(10)
+        return {"client": creation_count}
+
+    scope.register_async_resolver("client", create_client, evaluate_once=True)
+
+    @ainject
+    async def use_client(client: dict = Inject["client"]) -> dict:
+        return client
+
+    async def run_test():
+        async with scope:
+            task = asyncio.create_task(use_client())
+            await started.wait()
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+            assert await use_client() == {"client": 2}
+            assert await use_client() == {"client": 2}
+
+    asyncio.run(run_test())
+
+
+def test_ainject_unstarted_evaluate_once_resolution_leaves_entry_unresolved():
+    """Test that a failed injection before awaiting does not leave an evaluate_once resolver pending."""
+    scope = DependencyScope()
+
+    async def create_client():
+        return {"client": "ready"}
+
+    scope.register_async_resolver("client", create_client, evaluate_once=True)
+
+    @ainject
+    async def use_client_and_missing(client: dict = Inject["client"], missing: str = Inject["missing"]) -> dict:
+        return client
+
+    @ainject
+    async def use_client(client: dict = Inject["client"]) -> dict:
+        return client
+
+    async def run_test():
+        async with scope:
+            with pytest.raises(DependencyNotFoundError):
+                await use_client_and_missing()
+            assert await asyncio.wait_for(use_client(), timeout=1) == {"client": "ready"}
+
+    asyncio.run(run_test())
+
+
+def test_ainject_lazy_async_dependency_after_inline_resolution():
+    """Test that a lazy evaluate_once async dependency is awaitable after @ainject has resolved it inline."""
+    scope = DependencyScope()
+
+    async def create_client():
+        return {"client": "ready"}
+
+    scope.register_async_resolver("client", create_client, evaluate_once=True)
+
+    @ainject
+    async def use_client(client: dict = Inject["client"]) -> dict:
+        return client
+
+    @ainject
+    async def get_lazy_client(client=InjectLazy["client"]):
+        return client
+
+    async def run_test():
+        async with scope:
+            client = await use_client()
+            lazy_client = await get_lazy_client()
+            assert await lazy_client() is client
+
+    asyncio.run(run_test())
+
+
+def test_ainject_failing_async_dependencies_leave_no_tasks_behind():
+    """Test that when one of several async dependencies fails, the others are cancelled and reaped."""
+    scope = DependencyScope()
+
+    async def fail_fast():
+        raise ValueError("first failure")
+
+    async def fail_slow():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("second failure")
+
+    scope.register_async_resolver("fast", fail_fast)
+    scope.register_async_resolver("slow", fail_slow)
+
+    @ainject
+    async def use_both(fast=Inject["fast"], slow=Inject["slow"]):
+        return fast, slow
+
+    async def run_test():
+        loop = asyncio.get_running_loop()
+        reported = []
+        loop.set_exception_handler(lambda _loop, context: reported.append(context))
+
+        async with scope:
+            with pytest.raises(ValueError, match="first failure"):
+                await use_both()
+
+        assert asyncio.all_tasks() == {asyncio.current_task()}
+        await asyncio.sleep(0.02)
+        gc.collect()
+        assert reported == []
+
+    asyncio.run(run_test())
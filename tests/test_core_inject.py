@@ -2,7 +2,7 @@
 
 import pytest
 
-from injectipy import DependencyNotFoundError, DependencyScope, Inject, inject
+from injectipy import DependencyNotFoundError, DependencyScope, Inject, InjectLazy, inject
 
 
 def test_inject_basic_function(basic_scope):
@@ -110,6 +110,44 @@ def test_inject_call_returns_self():
     assert result is inject_obj
 
 
+def test_inject_markers_are_interned_per_key():
+    """Test that Inject[key] returns one shared marker per key."""
+    assert Inject["test_key"] is Inject["test_key"]
+    assert Inject[int] is Inject[int]
+    assert Inject["test_key"] is not Inject["other_key"]
+    assert Inject[int].get_inject_key() is int
+
+
+def test_inject_string_keys_are_interned():
+    """Test that dynamically built string keys are interned."""
+    import sys
+
+    key = "".join(["dynamic", "_key"])
+    assert Inject[key].get_inject_key() is sys.intern("dynamic_key")
+
+
+def test_inject_markers_have_no_instance_dict():
+    """Test that Inject markers are slotted and carry no per-instance __dict__."""
+    assert not hasattr(Inject["test_key"], "__dict__")
+    assert not hasattr(InjectLazy["test_key"], "__dict__")
+
+
+def test_inject_does_not_mutate_function_defaults(basic_scope):
+    """Test that injection passes arguments instead of rewriting the function's defaults."""
+    with basic_scope:
+
+        def my_function(name: str, service: str = Inject["service"], *, config: dict = Inject["config"]) -> str:
+            return f"{name}: {service}"
+
+        original_defaults = my_function.__defaults__
+        original_kwdefaults = dict(my_function.__kwdefaults__)
+        injected = inject(my_function)
+
+        assert injected("a") == "a: injected_service"
+        assert my_function.__defaults__ is original_defaults
+        assert my_function.__kwdefaults__ == original_kwdefaults
+
+
 def test_inject_preserves_function_metadata(basic_scope):
     """Test that @inject preserves function name, docstring, etc."""
     with basic_scope:
@@ -136,3 +174,111 @@ def test_inject_multiple_dependencies():
 
         result = multi_inject("manual")
         assert result == "a=manual, b=value1, c=value2, d=value3"
+
+
+def test_inject_does_not_introspect_signature_per_call(basic_scope, monkeypatch):
+    """Test that the injection plan is computed at decoration time, not per call."""
+    import inspect
+
+    with basic_scope:
+
+        @inject
+        def my_function(name: str, service: str = Inject["service"]) -> str:
+            return f"{name}: {service}"
+
+        def fail_signature(*_args, **_kwargs):
+            raise AssertionError("inspect.signature called during injection")
+
+        monkeypatch.setattr(inspect, "signature", fail_signature)
+
+        assert my_function("a") == "a: injected_service"
+        assert my_function("b", "explicit") == "b: explicit"
+        assert my_function("c", service="keyword") == "c: keyword"
+
+
+def test_inject_positional_argument_skips_resolution():
+    """Test that arguments passed positionally are never resolved from scopes."""
+
+    @inject
+    def func(a: str, missing: str = Inject["nonexistent"]) -> str:
+        return f"{a}, {missing}"
+
+    assert func("x", "provided") == "x, provided"
+
+
+@pytest.mark.parametrize(
+    "args,kwargs",
+    [
+        (("x",), {"unknown": 1}),
+        (("x",), {"a": "y"}),
+        (("x", "y", "z"), {}),
+    ],
+    ids=["unknown_keyword", "duplicate_keyword", "too_many_positional"],
+)
+def test_inject_invalid_arguments_raise_type_error_before_resolution(args, kwargs):
+    """Test that invalid call arguments take priority over a missing dependency."""
+
+    @inject
+    def func(a: str, missing: str = Inject["nonexistent"]) -> str:
+        return f"{a}, {missing}"
+
+    with pytest.raises(TypeError):
+        func(*args, **kwargs)
+
+
+def test_inject_lazy_resolves_on_first_call():
+    """Test that InjectLazy defers resolution until the injected callable is called."""
+    call_count = 0
+
+    def create_service() -> str:
+        nonlocal call_count
+        call_count += 1
+        return "lazy_service"
+
+    with DependencyScope() as scope:
+        scope.register_resolver("service", create_service)
+
+        class MyClass:
+            @inject
+            def __init__(self, service=InjectLazy["service"]):
+                self.service = service
+
+        obj = MyClass()
+        assert call_count == 0
+
+        assert obj.service() == "lazy_service"
+        assert obj.service() == "lazy_service"
+        assert call_count == 1
+
+
+def test_inject_lazy_uses_scopes_active_at_call_time():
+    """Test that a lazy dependency resolves against the scopes active when the function was called."""
+    import threading
+
+    @inject
+    def get_config(config=InjectLazy["config"]):
+        return config
+
+    results = []
+    with DependencyScope() as scope:
+        scope.register_value("config", "scoped_config")
+        lazy_config = get_config()
+
+        # The new thread has no active scopes of its own
+        thread = threading.Thread(target=lambda: results.append(lazy_config()))
+        thread.start()
+        thread.join()
+
+    assert results == ["scoped_config"]
+
+
+def test_inject_lazy_missing_dependency_raises_on_first_call():
+    """Test that a missing lazy dependency is reported when first resolved."""
+
+    @inject
+    def func(missing=InjectLazy["nonexistent"]):
+        return missing
+
+    lazy_missing = func()
+    with pytest.raises(DependencyNotFoundError, match="Dependency 'nonexistent' not found in function 'func'"):
+        lazy_missing()
@@ -1,5 +1,6 @@
 """Tests for DependencyScope functionality and context management."""
 
+import sys
 import threading
 import time
 
@@ -313,6 +314,28 @@ class TestErrorHandling:
         with pytest.raises(CircularDependencyError, match="Circular dependency"):
             scope.register_resolver("service_b", service_b)
 
+    def test_deep_dependency_chain_registration(self):
+        """Test that cycle detection walks long dependency chains without recursing."""
+        scope = DependencyScope()
+        chain_length = sys.getrecursionlimit() * 2
+
+        for i in range(chain_length):
+            scope.register_resolver(f"node_{i}", lambda dep=Inject[f"node_{i + 1}"]: dep)
+
+        scope.register_resolver("top", lambda dep=Inject["node_0"]: dep)
+        assert scope.contains("top")
+
+    def test_deep_circular_dependency_detection(self):
+        """Test that a cycle through a long dependency chain is reported without recursing."""
+        scope = DependencyScope()
+        chain_length = sys.getrecursionlimit() * 2
+
+        for i in range(chain_length):
+            scope.register_resolver(f"node_{i}", lambda dep=Inject[f"node_{i + 1}"]: dep)
+
+        with pytest.raises(CircularDependencyError, match="node_0 -> node_1 -> node_2"):
+            scope.register_resolver(f"node_{chain_length}", lambda dep=Inject["node_0"]: dep)
+
     def test_invalid_resolver_parameters(self):
         """Test removed - parameter validation simplified."""
         pass  # Test removed for simplicity
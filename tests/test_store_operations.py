@@ -1,5 +1,8 @@
 """DependencyScope operations and functionality tests."""
 
+import sys
+import threading
+
 import pytest
 
 from injectipy import (
@@ -7,7 +10,9 @@ from injectipy import (
     DependencyScope,
     DuplicateRegistrationError,
     Inject,
+    InjectLazy,
     InvalidStoreOperationError,
+    ParameterValidationError,
 )
 
 
@@ -38,6 +43,41 @@ def test_register_value(scope: DependencyScope, key, value):
         assert scope[key] == value
 
 
+def test_register_values(scope: DependencyScope):
+    """Test registering several static values at once."""
+    with scope:
+        result = scope.register_values({"host": "localhost", "port": 5432, int: 42})
+        assert result is scope
+        assert scope["host"] == "localhost"
+        assert scope["port"] == 5432
+        assert scope[int] == 42
+
+
+def test_register_values_duplicate_is_atomic(scope: DependencyScope):
+    """Test that a duplicate key in register_values registers nothing."""
+    scope.register_value("port", 5432)
+
+    with pytest.raises(DuplicateRegistrationError):
+        scope.register_values({"host": "localhost", "port": 6379})
+
+    assert not scope.contains("host")
+    assert scope["port"] == 5432
+
+
+def test_registered_string_keys_are_interned(scope: DependencyScope):
+    """Test that string keys are interned on registration so lookups match by identity."""
+    value_key = "".join(["dynamic", "_value"])
+    resolver_key = "".join(["dynamic", "_resolver"])
+    scope.register_value(value_key, 1)
+    scope.register_resolver(resolver_key, lambda: 2)
+    scope.register_values({"".join(["dynamic", "_bulk"]): 3})
+
+    registered_keys = list(scope._registry)
+    assert registered_keys[0] is sys.intern("dynamic_value")
+    assert registered_keys[1] is sys.intern("dynamic_resolver")
+    assert registered_keys[2] is sys.intern("dynamic_bulk")
+
+
 def test_register_resolver(scope: DependencyScope):
     """Test registering resolver functions."""
     with scope:
@@ -97,6 +137,43 @@ def test_resolver_with_dependencies(scope: DependencyScope):
         assert scope["dependent"] == "built_on_foundation"
 
 
+def test_resolver_signature_inspected_at_registration(scope: DependencyScope, monkeypatch):
+    """Test resolver dependencies are precomputed so resolution skips introspection."""
+    import inspect
+
+    with scope:
+        scope.register_value("base", "foundation")
+
+        def dependent_resolver(base_dep: str = Inject["base"]) -> str:
+            return f"built_on_{base_dep}"
+
+        scope.register_resolver("dependent", dependent_resolver)
+
+        def fail_signature(*_args, **_kwargs):
+            raise AssertionError("inspect.signature called during resolution")
+
+        monkeypatch.setattr(inspect, "signature", fail_signature)
+        assert scope["dependent"] == "built_on_foundation"
+
+
+def test_resolver_with_inject_lazy_parameter_rejected(scope: DependencyScope):
+    """Test InjectLazy in a resolver signature is rejected at registration."""
+
+    def lazy_resolver(base: str = InjectLazy["base"]) -> str:
+        return base
+
+    async def async_lazy_resolver(base: str = InjectLazy["base"]) -> str:
+        return base
+
+    with pytest.raises(ParameterValidationError, match="InjectLazy"):
+        scope.register_resolver("lazy", lazy_resolver)
+    with pytest.raises(ParameterValidationError, match="InjectLazy"):
+        scope.register_async_resolver("async_lazy", async_lazy_resolver)
+
+    assert not scope.contains("lazy")
+    assert not scope.contains("async_lazy")
+
+
 def test_evaluate_once_caching(scope: DependencyScope):
     """Test evaluate_once=True caches resolver results."""
     call_count = 0
@@ -119,6 +196,73 @@ def test_evaluate_once_caching(scope: DependencyScope):
     assert call_count == 1  # Not called again
 
 
+def test_evaluate_once_caches_none_result(scope: DependencyScope):
+    """Test evaluate_once=True caches a None result instead of re-running the resolver."""
+    call_count = 0
+
+    def none_resolver() -> None:
+        nonlocal call_count
+        call_count += 1
+
+    scope.register_resolver("nothing", none_resolver, evaluate_once=True)
+
+    assert scope["nothing"] is None
+    assert scope["nothing"] is None
+    assert call_count == 1
+
+
+def test_preload_evaluates_singletons(scope: DependencyScope):
+    """Test preload() eagerly creates evaluate_once resolvers, including their dependencies."""
+    calls = []
+
+    def create_db(config: str = Inject["config"]) -> str:
+        calls.append("db")
+        return f"db({config})"
+
+    def create_config() -> str:
+        calls.append("config")
+        return "config"
+
+    def create_request() -> str:
+        calls.append("request")
+        return "request"
+
+    with scope:
+        scope.register_resolver("db", create_db, evaluate_once=True)
+        scope.register_resolver("config", create_config, evaluate_once=True)
+        scope.register_resolver("request", create_request)
+
+        assert scope.preload() is scope
+        assert sorted(calls) == ["config", "db"]
+
+        assert scope["db"] == "db(config)"
+        assert sorted(calls) == ["config", "db"]
+
+
+def test_preload_requires_active_scope(scope: DependencyScope):
+    """Test preload() outside the scope's context raises an error."""
+    with pytest.raises(InvalidStoreOperationError):
+        scope.preload()
+
+
+def test_preload_requires_scope_active_in_current_thread(scope: DependencyScope):
+    """Test preload() from a thread where the scope was not entered raises an error."""
+    errors = []
+
+    def preload_in_thread():
+        try:
+            scope.preload()
+        except InvalidStoreOperationError as e:
+            errors.append(e)
+
+    with scope:
+        thread = threading.Thread(target=preload_in_thread)
+        thread.start()
+        thread.join()
+
+    assert len(errors) == 1
+
+
 def test_context_manager_cleanup():
     """Test context manager cleanup."""
     scope = DependencyScope()
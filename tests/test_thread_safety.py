@@ -34,11 +34,6 @@ def test_concurrent_registration():
     results = []
     errors = []
 
-    # Use timestamp to ensure unique keys across test runs
-    import time
-
-    timestamp = str(int(time.time() * 1000000))
-
     def register_value(key: str, value: str):
         try:
             store.register_value(key, value)
@@ -49,7 +44,7 @@ def test_concurrent_registration():
     with concurrent.futures.ThreadPoolExecutor(max_workers=10) as executor:
         futures = []
         for i in range(100):
-            future = executor.submit(register_value, f"reg_key_{timestamp}_{i}", f"value_{i}")
+            future = executor.submit(register_value, f"reg_key_{i}", f"value_{i}")
             futures.append(future)
 
         concurrent.futures.wait(futures)
@@ -67,12 +62,8 @@ def test_concurrent_access():
     """Test that concurrent access to the store is thread-safe."""
     store = DependencyScope()
 
-    # Pre-register some values with unique keys
-    import time
-
-    timestamp = str(int(time.time() * 1000000))
     for i in range(10):
-        store.register_value(f"access_key_{timestamp}_{i}", f"value_{i}")
+        store.register_value(f"access_key_{i}", f"value_{i}")
 
     results = []
     errors = []
@@ -88,7 +79,7 @@ def test_concurrent_access():
         futures = []
         for _ in range(100):
             for i in range(10):
-                future = executor.submit(access_value, f"access_key_{timestamp}_{i}")
+                future = executor.submit(access_value, f"access_key_{i}")
                 futures.append(future)
 
         concurrent.futures.wait(futures)
@@ -110,9 +101,7 @@ def test_concurrent_resolver_execution():
     execution_count = 0
     execution_lock = threading.Lock()
 
-    # Use timestamp for unique key
-    timestamp = str(int(time.time() * 1000000))
-    resolver_key = f"slow_key_{timestamp}"
+    resolver_key = "slow_key"
 
     def slow_resolver():
         nonlocal execution_count
@@ -148,9 +137,7 @@ def test_concurrent_evaluate_once_resolver():
     execution_count = 0
     execution_lock = threading.Lock()
 
-    # Use timestamp for unique key
-    timestamp = str(int(time.time() * 1000000))
-    cached_key = f"cached_key_{timestamp}"
+    cached_key = "cached_key"
 
     def slow_resolver():
         nonlocal execution_count
@@ -182,6 +169,32 @@ def test_concurrent_evaluate_once_resolver():
     assert all(result == "cached_result_1" for result in results)
 
 
+def test_values_readable_while_resolver_runs():
+    """Test that reading plain values does not wait for a resolver running in another thread."""
+    store = DependencyScope()
+    resolver_started = threading.Event()
+    release_resolver = threading.Event()
+
+    def blocking_resolver():
+        resolver_started.set()
+        release_resolver.wait(timeout=5)
+        return "slow_result"
+
+    store.register_value("config", "fast_value")
+    store.register_resolver("slow", blocking_resolver, evaluate_once=True)
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        slow_future = executor.submit(lambda: store["slow"])
+        assert resolver_started.wait(timeout=5)
+
+        # The resolver holds the scope lock; the value read must not block on it
+        value_future = executor.submit(lambda: store["config"])
+        assert value_future.result(timeout=1) == "fast_value"
+
+        release_resolver.set()
+        assert slow_future.result(timeout=5) == "slow_result"
+
+
 def test_concurrent_mixed_operations():
     """Test concurrent registration and access operations."""
     store = DependencyScope()